@@ -1,24 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+import csv
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import json
+from functools import cache
+import io
 import os
-import time
+import re
+import sys
+from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 from loguru import logger
+import orjson
 import pandas as pd
-import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 # ====================== Environment / Global Variables =======================
 load_dotenv(override=True)
 
 # Initialize customer constant global variables.
-with open('/vault/secrets/nc_fail', 'r') as file:
-    CUSTOMER_CONFIGS_FILE_JSON = json.load(file)
-CUSTOMER_CONFIGS_STRING = CUSTOMER_CONFIGS_FILE_JSON['data']['customer_configs']
-CUSTOMER_CONFIGS = json.loads(CUSTOMER_CONFIGS_STRING)
+CUSTOMER_CONFIGS_FILE_PATH = '/vault/secrets/nc_fail'
 
 # Initialize Email API constant global variables.
 EMAIL_API_BASE_URL = os.getenv('EMAIL_API_BASE_URL')
@@ -27,11 +31,18 @@ EMAIL_API_KEY = os.getenv('EMAIL_API_TOKEN')
 # Initialize NetCloud constant global variables.
 NETCLOUD_BASE_API_URL = 'https://www.cradlepointecm.com/api/v2'
 NETCLOUD_API_MAX_LIMIT = 100
+NETCLOUD_API_MAX_WORKERS = 16
+NETCLOUD_API_MAX_RETRIES = 5
+NETCLOUD_API_TIMEOUT = 30  # In seconds.
+
+# Initialize the number of customers to run the reporter for concurrently.
+MAX_CUSTOMER_WORKERS = 8
 
 # Initialize other constant global variables.
 DIGITAL_INNOVATION_REPORTING_INBOX = os.getenv('DIGITAL_INNOVATION_REPORTING_INBOX')
 CSV_BASE_FILE_NAME = 'netcloud_failover_report'
 REPORT_TIME_FORMAT = '%m/%d/%Y %I:%M:%S %p %Z'
+UNKNOWN_ROUTER_INFO = 'Unknown'  # For routers NetCloud can no longer find.
 REPORT_COLUMN_LABELS = [
     'Router Name',
     'Router MAC Address',
@@ -41,6 +52,12 @@ REPORT_COLUMN_LABELS = [
 ]
 SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
 
+# Matches the parts of a failover alert's "friendly_info" field used for the
+# report: the first sentence without its trailing " at <datetime>", the ISO
+# 8601 datetime itself (the last word of the first sentence, with or without
+# fractional seconds), and the sentence after the first one.
+FRIENDLY_INFO_REGEX = re.compile(r'^(?P<head>.*?)(?:\s+at)?\s+(?P<datetime>\S+?)\.\s+(?P<tail>[^.]*)')
+
 
 # ================================== Classes ==================================
 class NetCloudFailoverAlert:
@@ -48,6 +65,8 @@ class NetCloudFailoverAlert:
     Represents a failover alert from the NetCloud API.
     """
     
+    __slots__ = ('created_at_utc', 'failover_info', 'router_number')
+    
     def __init__(self, **kwargs):
         """
         Initializes the failover alert's created at datetime, the friendly
@@ -55,32 +74,31 @@ class NetCloudFailoverAlert:
         
         Format of kwargs:
         {
+            'id': str,
             'friendly_info': str,
-            'router': str
+            'router': str,
+            'created_at': str
         }
         """
         
-        # Extract the first sentence from the failover alert's "friendly_info"
-        # field that contains the datetime string.
-        failover_info_first_sentence = kwargs['friendly_info'].split('. ')[0]
-        
-        # Extract just the datetime string from the first sentence.
-        failover_info_datetime_str = failover_info_first_sentence.split(' ')[-1]
+        # Split the failover alert's "friendly_info" field into its parts.
+        friendly_info_match = FRIENDLY_INFO_REGEX.match(kwargs['friendly_info'])
+        if friendly_info_match is None:
+            raise ValueError(f'Unrecognized failover alert "friendly_info" field: {kwargs['friendly_info']}')
         
         # Convert the datetime string to a datetime object in UTC.
-        failover_datetime_utc = datetime.fromisoformat(failover_info_datetime_str)
+        failover_datetime_utc = datetime.fromisoformat(friendly_info_match['datetime'])
         
         self.created_at_utc = failover_datetime_utc
         
         # Format the "failover_info" field to make it look pretty.
-        failover_info_str_split = kwargs['friendly_info'].split('.')
-        failover_info_str = f'{failover_info_str_split[0][:-23]}.{failover_info_str_split[2]}.'
+        failover_info_str = f'{friendly_info_match['head']}. {friendly_info_match['tail']}.'
         
         self.failover_info = failover_info_str
         
         # Extract the router number from the failover alert's "router" field.
         router_url = kwargs['router']
-        router_number = router_url.split('/')[-2]
+        router_number = router_url.rstrip('/').rpartition('/')[2]
         
         self.router_number = router_number
 
@@ -90,6 +108,8 @@ class NetCloudRouter:
     Represents a router in NetCloud.
     """
     
+    __slots__ = ('name', 'mac_address', 'serial_number')
+    
     def __init__(self, **kwargs):
         """
         Initializes the router's name, MAC address, and serial number.
@@ -108,6 +128,57 @@ class NetCloudRouter:
 
 
 # ================================= Functions =================================
+def create_session() -> requests.Session:
+    """
+    Creates a requests session for one customer's API calls. Every customer
+    gets their own session so the cookies NetCloud sets for one customer are
+    never sent with another customer's requests.
+
+    Returns:
+        requests.Session: The requests session for one customer's API calls.
+    """
+    
+    # Create the session so connections are kept alive and reused. The
+    # connection pool is sized for the number of concurrent workers per
+    # customer. Rate limited (429) and transient server error responses are
+    # retried with an exponential backoff that honors the "Retry-After"
+    # header, so the workers slow down whenever NetCloud starts pushing back.
+    # POST requests are never retried so a report is not emailed twice.
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=2,  # NetCloud API and Email API.
+        pool_maxsize=NETCLOUD_API_MAX_WORKERS,
+        max_retries=Retry(
+            total=NETCLOUD_API_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    ))
+    
+    # Return the session.
+    return session
+
+
+@cache
+def load_customer_configs() -> list[dict]:
+    """
+    Loads the customer configs from the Vault secrets file. The file is only
+    read and parsed the first time this is called.
+
+    Returns:
+        list[dict]: The customer configs.
+    """
+    
+    # Read the Vault secrets file, which holds the customer configs as a JSON
+    # string.
+    with open(CUSTOMER_CONFIGS_FILE_PATH, 'rb') as file:
+        customer_configs_file_json = orjson.loads(file.read())
+    customer_configs_string = customer_configs_file_json['data']['customer_configs']
+    
+    # Return the parsed customer configs.
+    return orjson.loads(customer_configs_string)
+
+
 def create_netcloud_api_headers(customer_netcloud_api_info: dict[str, str]) -> dict[str, str]:
     """
     Creates a header dictionary using the provided NetCloud API info found
@@ -140,22 +211,65 @@ def create_netcloud_api_headers(customer_netcloud_api_info: dict[str, str]) -> d
     return netcloud_api_headers
 
 
-def get_all_netcloud_failovers_since_last_month(customer_config: dict) -> list[NetCloudFailoverAlert]:
+def get_netcloud_api_response(url: str, netcloud_api_headers: dict[str, str], session: requests.Session, params: dict | None = None) -> dict:
+    """
+    Makes a GET request to the provided NetCloud API URL and returns the
+    parsed JSON response.
+
+    Args:
+        url (str): The NetCloud API URL to request.
+        netcloud_api_headers (dict[str, str]): The headers for making calls to
+            the NetCloud API.
+        session (requests.Session): The requests session for this customer's
+            API calls.
+        params (dict | None, optional): The query parameters for the request.
+            Defaults to None.
+
+    Returns:
+        dict: The parsed JSON response from the NetCloud API.
+    """
+    
+    # Make the request to the NetCloud API. The session only retries before a
+    # response arrives, so also retry responses whose payload gets cut off.
+    for attempt in range(1, NETCLOUD_API_MAX_RETRIES + 1):
+        try:
+            netcloud_raw_response = session.get(
+                url=url,
+                params=params,
+                headers=netcloud_api_headers,
+                timeout=NETCLOUD_API_TIMEOUT
+            )
+            break
+        except requests.exceptions.ChunkedEncodingError:
+            # Give up if this was the last attempt.
+            if attempt == NETCLOUD_API_MAX_RETRIES:
+                raise
+            
+            logger.warning(f'Incomplete response payload from NetCloud, retrying ({attempt}/{NETCLOUD_API_MAX_RETRIES})...')
+    
+    # Return the parsed JSON response.
+    return orjson.loads(netcloud_raw_response.content)
+
+
+def get_all_netcloud_failovers_since_last_month(customer_config: dict, session: requests.Session) -> list[NetCloudFailoverAlert]:
     """
     Gathers and returns all failover alerts for the provided customer since 5
-    minutes before last month's beginning up until right now. This is to
-    compensate for NetClouds true timestamp of when a failover occurred versus 
-    what the "created_at" and "detected_at" fields in a failover alert returned 
-    from the NetCloud API. This information is extracted from the
-    "friendly_info" field and provides a more accurate timestamp of a failover 
-    alert's occurrance.
+    minutes before last month's beginning up until 5 minutes after this
+    month's beginning. This is to compensate for NetClouds true timestamp of
+    when a failover occurred versus what the "created_at" and "detected_at"
+    fields in a failover alert returned from the NetCloud API. This
+    information is extracted from the "friendly_info" field and provides a
+    more accurate timestamp of a failover alert's occurrance.
 
     Args:
         customer_config (dict): The customer's config.
+        session (requests.Session): The requests session for this customer's
+            API calls.
 
     Returns:
         list[NetCloudFailoverAlert]: The list of failover alerts since 5
-            minutes before last month's beginning up until right now.
+            minutes before last month's beginning up until 5 minutes after
+            this month's beginning.
     """
     
     # Initialize the return list.
@@ -163,97 +277,155 @@ def get_all_netcloud_failovers_since_last_month(customer_config: dict) -> list[N
     
     # Get the datetime 5 minutes before the beginning of last month in the
     # customer's timezone.
-    today = datetime.today()
-    customers_today = today.astimezone(pytz.timezone(customer_config['timezone']))
+    customers_today = datetime.now(ZoneInfo(customer_config['timezone']))
     customers_end_of_today = customers_today.replace(hour=23, minute=55, second=0, microsecond=0)
     customers_last_month_beginning = customers_end_of_today + relativedelta(day=31, months=-2)
     
+    # Get the datetime 5 minutes after the beginning of this month in the
+    # customer's timezone so NetCloud does not return this month's failovers.
+    customers_this_month_beginning = customers_today.replace(day=1, hour=0, minute=5, second=0, microsecond=0)
+    
     # Create the headers for the NetCloud API for this customer.
     netcloud_api_headers = create_netcloud_api_headers(customer_config['netcloud_api_info'])
     
-    # Request for the first page of failover alerts from NetCloud.
-    netcloud_failovers_raw_response = requests.get(
-            url=f'{NETCLOUD_BASE_API_URL}/alerts/',
-            params={
-                'type': 'failover_event',
-                'fields': 'friendly_info,router',
-                'limit': NETCLOUD_API_MAX_LIMIT,
-                'created_at__gt': customers_last_month_beginning.isoformat().replace('+', '%2b')
-            },
-            headers=netcloud_api_headers
+    # Request for the first page of failover alerts from NetCloud, oldest
+    # first so the last failover alert of a page marks where the next begins.
+    netcloud_failovers_url = f'{NETCLOUD_BASE_API_URL}/alerts/'
+    netcloud_failovers_params = {
+        'type': 'failover_event',
+        'fields': 'id,friendly_info,router,created_at',
+        'limit': NETCLOUD_API_MAX_LIMIT,
+        'order_by': 'created_at',
+        'created_at__lt': customers_this_month_beginning.isoformat()
+    }
+    netcloud_failovers_response = get_netcloud_api_response(
+            url=netcloud_failovers_url,
+            params=netcloud_failovers_params | {'created_at__gt': customers_last_month_beginning.isoformat()},
+            netcloud_api_headers=netcloud_api_headers,
+            session=session
     )
-    netcloud_failovers_response = netcloud_failovers_raw_response.json()
-    
-    # Add the failovers to the returning list.
-    all_failover_alerts.extend([NetCloudFailoverAlert(**failover_alert) for failover_alert in netcloud_failovers_response['data']])
-    
-    # Check if there is not another page of failovers to collect.
-    next_page_of_failovers_url = netcloud_failovers_response['meta']['next']
-    if not next_page_of_failovers_url:
-        # Return the failovers we gathered since there are no more pages of
-        # failover alerts to collect.
-        return all_failover_alerts
-    
-    # Gather all failover alerts one page at a time from NetCloud.
-    while next_page_of_failovers_url:
-        # Request the next page of failover alerts from NetCloud.
-        netcloud_failovers_raw_response = requests.get(
-                url=next_page_of_failovers_url,
-                headers=netcloud_api_headers
-        )
-        netcloud_failovers_response = netcloud_failovers_raw_response.json()
-        
-        # Add all the failover alerts from the response to the return list.
-        all_failover_alerts.extend([NetCloudFailoverAlert(**failover_alert) for failover_alert in netcloud_failovers_response['data']])
-        
-        # Save the URL to the next page. Will be None if no URL exists.
-        next_page_of_failovers_url = netcloud_failovers_response['meta']['next']
+    
+    # Keep track of the failover alerts already gathered. Every page after
+    # the first starts at the last "created_at" of the page before it, so
+    # failover alerts sharing that timestamp are not skipped but are
+    # requested again.
+    seen_failover_alert_ids = set()
+    
+    # Gather all failover alerts one page at a time from NetCloud. The next
+    # page is requested in the background while the current page is processed.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while netcloud_failovers_response:
+            # Request the page of failover alerts created at or after the last
+            # one on this page if this page was full. A partial page means
+            # there are no more.
+            netcloud_failovers_page = netcloud_failovers_response['data']
+            next_page_of_failovers_future = None
+            if len(netcloud_failovers_page) == NETCLOUD_API_MAX_LIMIT:
+                # Check if every failover alert on this page has the same
+                # "created_at". Starting the next page at that timestamp would
+                # return this page again, so follow NetCloud's link to the
+                # next page instead, if there is one.
+                if netcloud_failovers_page[0]['created_at'] == netcloud_failovers_page[-1]['created_at']:
+                    if netcloud_failovers_response['meta']['next']:
+                        next_page_of_failovers_future = executor.submit(
+                            get_netcloud_api_response,
+                            url=netcloud_failovers_response['meta']['next'],
+                            netcloud_api_headers=netcloud_api_headers,
+                            session=session
+                        )
+                else:
+                    next_page_of_failovers_future = executor.submit(
+                        get_netcloud_api_response,
+                        url=netcloud_failovers_url,
+                        params=netcloud_failovers_params | {'created_at__gte': netcloud_failovers_page[-1]['created_at']},
+                        netcloud_api_headers=netcloud_api_headers,
+                        session=session
+                    )
+            
+            # Add all the failover alerts from the response that have not
+            # been gathered yet to the return list.
+            for failover_alert in netcloud_failovers_page:
+                if failover_alert['id'] in seen_failover_alert_ids:
+                    continue
+                seen_failover_alert_ids.add(failover_alert['id'])
+                
+                # Skip any failover alert whose "friendly_info" field cannot
+                # be parsed so one odd alert does not stop the whole report.
+                try:
+                    all_failover_alerts.append(NetCloudFailoverAlert(**failover_alert))
+                except ValueError as error:
+                    logger.error(f'Skipping failover alert {failover_alert['id']} for {customer_config['name']}: {error}')
+            
+            # Wait for the next page of failover alerts. Will be None if there
+            # are no more pages of failover alerts to collect.
+            netcloud_failovers_response = next_page_of_failovers_future.result() if next_page_of_failovers_future else None
     
     # Return all the failover alerts.
     return all_failover_alerts
 
 
-def is_in_customer_timeframe(failover_alert_utc_datetime: datetime, customer_config: dict) -> bool:
+def get_minute_of_day(time_str: str) -> int:
     """
-    Checks if the provided UTC datetime (in ISO 8601 format) of a failover
-    alert falls inside the provided customer's timeframe. Returns true if it
-    does, false otherwise. A customer's timezone will always be used to
-    calculate if the failover alert falls inside a timeframe or if it falls
-    inside last month. If a customer is not using the timeframe feature, this
-    function will return true if the failover alert falls inside last month,
-    false otherwise.
+    Converts the provided time of day in "HH:MM" format into the number of
+    minutes since midnight.
 
     Args:
-        failover_alert_utc_datetime (datetime): The failover alert's UTC
-            datetime in ISO 8601 format.
-        customer_config (dict): The customer config.
+        time_str (str): The time of day in "HH:MM" format.
 
     Returns:
-        bool: Returns true if the failover alert falls inside the customer's
-            timeframe, false otherwise. If no timeframe is being used, returns
-            true if the failover alert falls inside last month in the
-            customer's timezone, false otherwise.
+        int: The number of minutes since midnight.
     """
     
-    # Convert the datetime string into a datetime object in the customer's timezone.
-    customer_timezone = customer_config['timezone']
-    failover_alert_datetime = failover_alert_utc_datetime.astimezone(pytz.timezone(customer_timezone))
-    is_in_last_month = failover_alert_datetime.month == (datetime.now() + relativedelta(months=-1)).month
+    # Return the number of minutes since midnight.
+    hours, minutes = time_str.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def is_in_customer_timeframe(failover_alert_datetimes: pd.DatetimeIndex, last_month: int, timeframe: dict) -> list[bool]:
+    """
+    Checks which of the provided failover alert datetimes fall inside the
+    provided customer's timeframe. Returns a boolean mask that is true for
+    every failover alert that does, false otherwise. The datetimes must
+    already be in the customer's timezone so it is used to calculate if a
+    failover alert falls inside a timeframe or if it falls inside last month.
+    If a customer is not using the timeframe feature, the mask is true for
+    every failover alert that falls inside last month, false otherwise.
+
+    Args:
+        failover_alert_datetimes (pd.DatetimeIndex): The failover alerts'
+            datetimes in the customer's timezone.
+        last_month (int): Last month's number in the customer's timezone.
+        timeframe (dict): The customer's timeframe with its days of the week
+            as a frozenset and its start / end times as minutes since
+            midnight. Empty if the customer is not using the timeframe
+            feature.
+
+    Returns:
+        list[bool]: A boolean mask that is true for every failover alert that
+            falls inside the customer's timeframe, false otherwise. If no
+            timeframe is being used, it is true for every failover alert that
+            falls inside last month in the customer's timezone, false
+            otherwise.
+    """
+    
+    # Check which failover alerts are in last month.
+    is_in_timeframe = failover_alert_datetimes.month == last_month
     
     # Check if this customer is not using the timeframe feature.
-    timeframe = customer_config['timeframe_info']
     if not timeframe:
-        return is_in_last_month
+        return is_in_timeframe.tolist()
     
-    # Make the timeframe start / end times into time objects.
-    timeframe_start = time.strptime(timeframe['start_time'], '%H:%M')
-    failover_alert_time = time.strptime(f'{failover_alert_datetime.hour}:{failover_alert_datetime.minute}', '%H:%M')
-    timeframe_end = time.strptime(timeframe['end_time'], '%H:%M')
+    # Check which failover alerts are on one of the timeframe's days. The
+    # datetimes' day of the week starts at 0 for Monday, so shift it to match
+    # the ISO weekday numbers used in the timeframe.
+    is_in_timeframe &= (failover_alert_datetimes.dayofweek + 1).isin(timeframe['days_of_the_week'])
     
-    # Return whether this failover is in the customer's timeframe or not.
-    return failover_alert_datetime.isoweekday() in timeframe['days_of_the_week'] and \
-        (timeframe_start <= failover_alert_time <= timeframe_end) and \
-        is_in_last_month
+    # Check which failover alerts are between the timeframe's times.
+    failover_alert_minutes = failover_alert_datetimes.hour * 60 + failover_alert_datetimes.minute
+    is_in_timeframe &= (failover_alert_minutes >= timeframe['start_minute']) & (failover_alert_minutes <= timeframe['end_minute'])
+    
+    # Return which failovers are in the customer's timeframe or not.
+    return is_in_timeframe.tolist()
 
 
 def filter_failovers_for_customer_timeframe(failover_alerts: list[NetCloudFailoverAlert], customer_config: dict) -> list[NetCloudFailoverAlert]:
@@ -271,22 +443,36 @@ def filter_failovers_for_customer_timeframe(failover_alerts: list[NetCloudFailov
             customer's timeframe.
     """
     
-    # Create the returning list.
-    filtered_failover_alerts = list[NetCloudFailoverAlert]()
+    # Get the customer's timezone, last month, and timeframe once for checking
+    # every alert.
+    customer_timezone = ZoneInfo(customer_config['timezone'])
+    last_month = (datetime.now(customer_timezone) + relativedelta(months=-1)).month
+    timeframe = customer_config['timeframe_info']
+    
+    # Convert the timeframe's times to minutes since midnight so the alerts
+    # only need integer comparisons.
+    if timeframe:
+        timeframe = {
+            'days_of_the_week': frozenset(timeframe['days_of_the_week']),
+            'start_minute': get_minute_of_day(timeframe['start_time']),
+            'end_minute': get_minute_of_day(timeframe['end_time'])
+        }
+    
+    # Convert every alert's datetime into the customer's timezone at once.
+    failover_alert_datetimes = pd.to_datetime(
+        [failover_alert.created_at_utc for failover_alert in failover_alerts],
+        utc=True
+    ).tz_convert(customer_timezone)
+    
+    # Check which alerts fall into the customer's timeframe and only keep
+    # those.
+    is_in_timeframe = is_in_customer_timeframe(failover_alert_datetimes, last_month, timeframe)
     
-    # For each alert, check if it falls into the customer's timeframe and add 
-    # it to the returning list if so.
-    for failover_alert in failover_alerts:
-        # Check if this failover alert falls inside the provided customer's
-        # configured timeframe. Add it to the filtered failover alerts if so.
-        if is_in_customer_timeframe(failover_alert.created_at_utc, customer_config):
-            filtered_failover_alerts.append(failover_alert)
-
     # Return the filtered failovers.
-    return filtered_failover_alerts
+    return [failover_alert for failover_alert, keep in zip(failover_alerts, is_in_timeframe) if keep]
 
 
-def get_last_months_failover_alerts(customer_config: dict) -> list[dict]:
+def get_last_months_failover_alerts(customer_config: dict, session: requests.Session) -> list[dict]:
     """
     Gathers all of last month's failover alerts for a given customer and
     filters them based off a customer's configured timeframe. Returns a list of
@@ -294,6 +480,8 @@ def get_last_months_failover_alerts(customer_config: dict) -> list[dict]:
 
     Args:
         customer_config (dict): The customer config.
+        session (requests.Session): The requests session for this customer's
+            API calls.
 
     Returns:
         list[dict]: A filtered list of last month's failover events based off
@@ -301,7 +489,7 @@ def get_last_months_failover_alerts(customer_config: dict) -> list[dict]:
     """
     
     # Gather all failover alerts from the past month.
-    last_months_failovers = get_all_netcloud_failovers_since_last_month(customer_config)
+    last_months_failovers = get_all_netcloud_failovers_since_last_month(customer_config, session)
 
     # Filter to only get failover alerts that are in the customer's timeframe.
     filtered_last_months_failovers = filter_failovers_for_customer_timeframe(last_months_failovers, customer_config)
@@ -310,7 +498,90 @@ def get_last_months_failover_alerts(customer_config: dict) -> list[dict]:
     return filtered_last_months_failovers
 
 
-def format_failover_alerts(failover_alerts: list[NetCloudFailoverAlert], customer_config: dict) -> list[list[str]]:
+def get_customer_file_name(customer_config: dict) -> str:
+    """
+    Returns the provided customer's name made safe to use in a file name.
+
+    Args:
+        customer_config (dict): The customer config.
+
+    Returns:
+        str: The customer's name made safe to use in a file name.
+    """
+    
+    # Return the customer's name with every run of non-word characters
+    # replaced by an underscore.
+    return re.sub(r'\W+', '_', customer_config['name']).strip('_').lower()
+
+
+def get_netcloud_router(router_number: str, netcloud_api_headers: dict[str, str], session: requests.Session) -> dict | None:
+    """
+    Requests the provided router's information from NetCloud. Returns None if
+    NetCloud could not find the router, like when it has been deleted.
+
+    Args:
+        router_number (str): The router's number in NetCloud.
+        netcloud_api_headers (dict[str, str]): The headers for making calls to
+            the NetCloud API.
+        session (requests.Session): The requests session for this customer's
+            API calls.
+
+    Returns:
+        dict | None: The router's raw information, or None if NetCloud could
+            not find the router.
+    """
+    
+    # Request router information from NetCloud. A router NetCloud could not
+    # find comes back as an error body without an "id", or not as JSON at all.
+    try:
+        netcloud_router_response = get_netcloud_api_response(
+            url=f'{NETCLOUD_BASE_API_URL}/routers/{router_number}/',
+            params={
+                'fields': 'id,name,mac,serial_number'
+            },
+            netcloud_api_headers=netcloud_api_headers,
+            session=session
+        )
+    except orjson.JSONDecodeError:
+        return None
+    
+    # Return the router's information if NetCloud found the router.
+    return netcloud_router_response if 'id' in netcloud_router_response else None
+
+
+def get_netcloud_routers(router_numbers: list[str], netcloud_api_headers: dict[str, str], session: requests.Session) -> list[dict]:
+    """
+    Requests the provided routers' information from NetCloud in a single
+    request. At most NETCLOUD_API_MAX_LIMIT routers can be requested at once.
+
+    Args:
+        router_numbers (list[str]): The routers' numbers in NetCloud.
+        netcloud_api_headers (dict[str, str]): The headers for making calls to
+            the NetCloud API.
+        session (requests.Session): The requests session for this customer's
+            API calls.
+
+    Returns:
+        list[dict]: The routers' raw information.
+    """
+    
+    # Request the routers' information from NetCloud.
+    netcloud_routers_response = get_netcloud_api_response(
+        url=f'{NETCLOUD_BASE_API_URL}/routers/',
+        params={
+            'id__in': ','.join(router_numbers),
+            'fields': 'id,name,mac,serial_number',
+            'limit': NETCLOUD_API_MAX_LIMIT
+        },
+        netcloud_api_headers=netcloud_api_headers,
+        session=session
+    )
+    
+    # Return the routers' information.
+    return netcloud_routers_response['data']
+
+
+def format_failover_alerts(failover_alerts: list[NetCloudFailoverAlert], customer_config: dict, session: requests.Session) -> dict[str, list[str]]:
     """
     Formats the provided raw failover alerts to look pretty for the CSV file
     report. Uses the customer's timezone to format the "Failover Timestamp" 
@@ -320,61 +591,81 @@ def format_failover_alerts(failover_alerts: list[NetCloudFailoverAlert], custome
         failover_alerts (list[NetCloudFailoverAlert]): The failover alerts to
             format.
         customer_config (dict): The customer config.
+        session (requests.Session): The requests session for this customer's
+            API calls.
 
     Returns:
-        list[list[str]]: A list of failover rows for the CSV file report.
+        dict[str, list[str]]: The columns of the CSV file report. Keys are the
+            report's column labels.
     """
     
-    # Create the returning list and a list of router information we gather
-    # over time.
-    netcloud_router_info = dict[str, NetCloudRouter]()  # Keys are the router's number.
-    formatted_failover_alerts = list[str]()
-    
     # Create the headers for the NetCloud API for this customer.
     netcloud_api_headers = create_netcloud_api_headers(customer_config['netcloud_api_info'])
     
-    # For each failover alert, format its information for CSV rows.
-    for failover_alert in failover_alerts:
-        # Initialize the list that will hold this row's values.
-        failover_alert_row = list[str]()
-
-        # Check if the router does not exist in the router dictionary.
-        if failover_alert.router_number not in netcloud_router_info.keys():
-            # Request router information from NetCloud.
-            netcloud_router_request = requests.get(
-                url=f'{NETCLOUD_BASE_API_URL}/routers/{failover_alert.router_number}/',
-                params={
-                    'fields': 'name,mac,serial_number'
-                },
-                headers=netcloud_api_headers
-            )
-            router_info = netcloud_router_request.json()
-
-            # Add router information to the router dictionary.
-            netcloud_router_info[failover_alert.router_number] = NetCloudRouter(**router_info)
-
-        # Add router information to the failover alert row.
-        failover_alerts_router = netcloud_router_info[failover_alert.router_number]
-        failover_alert_row.append(failover_alerts_router.name)
-        failover_alert_row.append(failover_alerts_router.mac_address)
-        failover_alert_row.append(failover_alerts_router.serial_number)
+    # Gather the unique routers across all the failover alerts.
+    unique_router_numbers = list({failover_alert.router_number for failover_alert in failover_alerts})
+    
+    # Split the routers into batches NetCloud can return at once.
+    router_number_batches = [
+        unique_router_numbers[index:index + NETCLOUD_API_MAX_LIMIT]
+        for index in range(0, len(unique_router_numbers), NETCLOUD_API_MAX_LIMIT)
+    ]
+    
+    # Request each batch of routers' information from NetCloud concurrently.
+    with ThreadPoolExecutor(max_workers=NETCLOUD_API_MAX_WORKERS) as executor:
+        netcloud_routers = [
+            router_info
+            for netcloud_routers_batch in executor.map(lambda router_number_batch: get_netcloud_routers(router_number_batch, netcloud_api_headers, session), router_number_batches)
+            for router_info in netcloud_routers_batch
+        ]
         
-        # Format the "Failover Timestamp" value for the customer's timezone.
-        failover_created_at_datetime = failover_alert.created_at_utc.astimezone(pytz.timezone(customer_config['timezone']))
-        failover_created_at_str = datetime.strftime(failover_created_at_datetime, REPORT_TIME_FORMAT)
-        failover_alert_row.append(failover_created_at_str)
-        
-        # Add the failover info to the failover alert row.
-        failover_alert_row.append(failover_alert.failover_info)
-
-        # Add the relevant failover record to the returning list.
-        formatted_failover_alerts.append(failover_alert_row)
+        # Request any routers the batches did not return one at a time.
+        returned_router_numbers = {str(router_info['id']) for router_info in netcloud_routers}
+        missing_router_numbers = [router_number for router_number in unique_router_numbers if router_number not in returned_router_numbers]
+        netcloud_routers.extend(
+            router_info
+            for router_info in executor.map(lambda router_number: get_netcloud_router(router_number, netcloud_api_headers, session), missing_router_numbers)
+            if router_info is not None
+        )
+    
+    # Create the router information for every router in the failover alerts.
+    netcloud_router_info = {  # Keys are the router's number.
+        str(router_info['id']): NetCloudRouter(**router_info) for router_info in netcloud_routers
+    }
+    
+    # Use placeholder information for any routers NetCloud could not find,
+    # like routers deleted since they failed over, so the report still gets
+    # made.
+    for router_number in unique_router_numbers:
+        if router_number not in netcloud_router_info:
+            logger.warning(f'Router {router_number} could not be found in NetCloud for {customer_config['name']}, using placeholder router information')
+            netcloud_router_info[router_number] = NetCloudRouter(
+                name=UNKNOWN_ROUTER_INFO,
+                mac=UNKNOWN_ROUTER_INFO,
+                serial_number=UNKNOWN_ROUTER_INFO
+            )
+    
+    # Format every "Failover Timestamp" value for the customer's timezone at
+    # once.
+    failover_timestamps = pd.to_datetime(
+        [failover_alert.created_at_utc for failover_alert in failover_alerts],
+        utc=True
+    ).tz_convert(ZoneInfo(customer_config['timezone'])).strftime(REPORT_TIME_FORMAT).tolist()
     
-    # Return the rows of formatted failover alerts.
-    return formatted_failover_alerts
+    # Look up the router of every failover alert.
+    failover_alerts_routers = [netcloud_router_info[failover_alert.router_number] for failover_alert in failover_alerts]
+    
+    # Return the columns of formatted failover alerts.
+    return dict(zip(REPORT_COLUMN_LABELS, [
+        [failover_alerts_router.name for failover_alerts_router in failover_alerts_routers],
+        [failover_alerts_router.mac_address for failover_alerts_router in failover_alerts_routers],
+        [failover_alerts_router.serial_number for failover_alerts_router in failover_alerts_routers],
+        failover_timestamps,
+        [failover_alert.failover_info for failover_alert in failover_alerts]
+    ]))
     
 
-def netcloud_failover_reporter(customer_config: dict) -> None:
+def netcloud_failover_reporter(customer_config: dict, session: requests.Session) -> None:
     """
     Gathers and formats all relevant failover events from last month for the
     provided customer config. Puts the report data into a CSV file and will
@@ -383,26 +674,42 @@ def netcloud_failover_reporter(customer_config: dict) -> None:
 
     Args:
         customer_config (dict): The customer configuration.
+        session (requests.Session): The requests session for this customer's
+            API calls.
     """
     
+    logger.info(f'Starting the NetCloud failover reporter for {customer_config['name']}...')
+    
     # Gather all relevant failover reports from last month for this customer.
-    logger.info('Gathering last month''s failover events...')
-    last_months_failover_alerts = get_last_months_failover_alerts(customer_config)
+    logger.info(f"Gathering last month's failover events for {customer_config['name']}...")
+    last_months_failover_alerts = get_last_months_failover_alerts(customer_config, session)
     
     # Format the failover alerts for the report.
-    logger.info('Formatting failover events...')
-    formated_failover_alerts = format_failover_alerts(last_months_failover_alerts, customer_config)
+    logger.info(f'Formatting failover events for {customer_config['name']}...')
+    formated_failover_alerts = format_failover_alerts(last_months_failover_alerts, customer_config, session)
     
     # Create a CSV file of the data.
-    logger.info('Generating a CSV file of failover events...')
-    failover_report_dataframe = pd.DataFrame(formated_failover_alerts, columns=REPORT_COLUMN_LABELS)
+    logger.info(f'Generating a CSV file of failover events for {customer_config['name']}...')
     one_month_ago = datetime.now() + relativedelta(months=-1)
-    failover_report_file_name = f'{one_month_ago.strftime('%Y-%m')}_{CSV_BASE_FILE_NAME}.csv'
+    failover_report_file_name = f'{one_month_ago.strftime('%Y-%m')}_{get_customer_file_name(customer_config)}_{CSV_BASE_FILE_NAME}.csv'
     failover_report_path = f'{SCRIPT_PATH}/../reports/{failover_report_file_name}'
-    failover_report_dataframe.to_csv(failover_report_path, index=None, header=True)
+    
+    # Write the rows straight from the report's columns into an in-memory CSV
+    # file so the same bytes can be saved and emailed.
+    failover_report_buffer = io.StringIO(newline='')
+    failover_report_writer = csv.writer(failover_report_buffer, lineterminator='\n')
+    failover_report_writer.writerow(formated_failover_alerts.keys())
+    failover_report_writer.writerows(zip(*formated_failover_alerts.values()))
+    failover_report_bytes = failover_report_buffer.getvalue().encode()
+    
+    # Save the CSV file in a single write to a temporary file, then move it
+    # into place so a failed run never leaves a partial report behind.
+    with open(f'{failover_report_path}.tmp', 'wb') as file:
+        file.write(failover_report_bytes)
+    os.replace(f'{failover_report_path}.tmp', failover_report_path)
 
     # Send the CSV file to the customer and our reporting email inbox.
-    logger.info('Emailing the CSV file of failover events...')
+    logger.info(f'Emailing the CSV file of failover events for {customer_config['name']}...')
     
     # Make the list of email recipients. Always include the reporting inbox.
     email_to = list()
@@ -410,7 +717,7 @@ def netcloud_failover_reporter(customer_config: dict) -> None:
     email_to.extend(customer_config['email_to'])
     
     # Send the failover report via email.
-    email_response = requests.post(
+    email_response = session.post(
         url=f'{EMAIL_API_BASE_URL}/emailReport/',
         data={
             'to': ', '.join(email_to),
@@ -420,16 +727,46 @@ def netcloud_failover_reporter(customer_config: dict) -> None:
         headers={
             'API_KEY': EMAIL_API_KEY
         },
-        files=[('files', open(failover_report_path, 'rb'))]
+        files=[('files', (failover_report_file_name, failover_report_bytes, 'text/csv'))]
     )
     
     # Check if the email was sent successfully or not.
     if email_response.ok:
-        logger.info('Successfully emailed the failover report!')
+        logger.info(f'Successfully emailed the failover report for {customer_config['name']}!')
     else:
-        logger.error('An error occurred emailing the failover report')
+        logger.error(f'An error occurred emailing the failover report for {customer_config['name']}')
         logger.error(f'Status code: {email_response.status_code}')
         logger.error(f'Reason: {email_response.reason}')
+    
+    logger.info(f'NetCloud failover reporter for {customer_config['name']} has completed!')
+
+
+def run_netcloud_failover_reporter(customer_config: dict) -> bool:
+    """
+    Runs the NetCloud failover reporter for the provided customer with its own
+    requests session. Any error is logged with the customer's name instead of
+    being raised so the other customers' reports still get made.
+
+    Args:
+        customer_config (dict): The customer configuration.
+
+    Returns:
+        bool: Returns true if the reporter succeeded for the customer, false
+            otherwise.
+    """
+    
+    # Run the NetCloud failover reporter for this customer. Only the error
+    # itself is logged, since a logged traceback would include the customer's
+    # NetCloud API keys.
+    try:
+        with create_session() as session:
+            netcloud_failover_reporter(customer_config, session)
+    except Exception as error:
+        logger.error(f'An error occurred running the NetCloud failover reporter for {customer_config['name']}: {error!r}')
+        return False
+    
+    # Return that the reporter succeeded for this customer.
+    return True
 
 
 def main() -> None:
@@ -443,13 +780,15 @@ def main() -> None:
     
     logger.info('Starting the NetCloud failover reporter...')
     
-    # For each customer, run the NetCloud failover reporter.
-    for customer_config in CUSTOMER_CONFIGS:
-        logger.info(f'Starting the NetCloud failover reporter for {customer_config['name']}...')
-        
-        netcloud_failover_reporter(customer_config)
-        
-        logger.info(f'NetCloud failover reporter for {customer_config['name']} has completed!')
+    # Run the NetCloud failover reporter for every customer concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_CUSTOMER_WORKERS) as executor:
+        customer_results = list(executor.map(run_netcloud_failover_reporter, load_customer_configs()))
+    
+    # Exit with an error if the reporter failed for any customer so the job
+    # is marked as failed.
+    if not all(customer_results):
+        logger.error(f'NetCloud failover reporter failed for {customer_results.count(False)} customer(s)!')
+        sys.exit(1)
     
     logger.info('NetCloud failover reporter completed!')
 